@@ -1,15 +1,292 @@
 from __future__ import annotations
 
+import calendar
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 
+import numpy as np
 import pandas as pd
 
 from sdgx.data_models.metadata import Metadata
 from sdgx.data_processors.extension import hookimpl
 from sdgx.data_processors.formatters.base import Formatter
-from sdgx.utils import logger
+from sdgx.utils import cache, logger
+
+UNIX_EPOCH = pd.Timestamp("1970-01-01")
+"""
+Naive datetime values are treated as UTC when converted to timestamp.
+"""
+
+ISO_DATETIME_FORMATS = frozenset(
+    {
+        "%Y-%m-%d",
+        "%Y-%m-%d %H:%M:%S",
+        "%Y-%m-%dT%H:%M:%S",
+        "%Y-%m-%d %H:%M:%S.%f",
+        "%Y-%m-%dT%H:%M:%S.%f",
+    }
+)
+"""
+ISO 8601 formats, which pandas parses with a fast path instead of the generic ``strptime``.
+"""
+
+MIN_TIMESTAMP = -62135596800
+MAX_TIMESTAMP = 253402300799
+"""
+Range of timestamps (in seconds) which can be converted back to datetime,
+from 0001-01-01 00:00:00 to 9999-12-31 23:59:59.
+"""
+
+MIN_NS_TIMESTAMP = -(-pd.Timestamp.min.value // 10**9)
+MAX_NS_TIMESTAMP = pd.Timestamp.max.value // 10**9
+"""
+Range of timestamps (in seconds) which pandas holds in nanoseconds, from 1677-09-21 to 2262-04-11.
+"""
+
+
+def _to_datetime(datetime_data, datetime_format: str):
+    """
+    Parse datetime strings by ``pd.to_datetime``, values which cannot be parsed become ``NaT``.
+
+    Formats with an UTC offset (``%z``) are parsed to naive UTC datetime,
+    which also works when the offsets are mixed.
+    """
+    if "%z" not in datetime_format:
+        return pd.to_datetime(datetime_data, format=datetime_format, errors="coerce")
+    res = pd.to_datetime(datetime_data, format=datetime_format, errors="coerce", utc=True)
+    if isinstance(res, pd.Series):
+        return res.dt.tz_convert(None)
+    return res.tz_convert(None)
+
+
+def _to_timestamp(datetime_data, datetime_format: str):
+    # Keep fractions only for formats with sub-second precision
+    if "%f" in datetime_format:
+        return (datetime_data - UNIX_EPOCH) / pd.Timedelta(seconds=1)
+    return (datetime_data - UNIX_EPOCH) // pd.Timedelta(seconds=1)
+
+
+def _strptime_timestamps(values: np.ndarray, datetime_format: str) -> np.ndarray:
+    """
+    Parse datetime strings one by one with ``datetime.strptime``, for the values beyond
+    the nanosecond range of pandas (1677-09-21 to 2262-04-11), e.g. ``9999-12-31``.
+
+    Values which cannot be parsed become NaN.
+    """
+    res = np.full(len(values), np.nan)
+    for i, each_value in enumerate(values):
+        try:
+            datetime_obj = datetime.strptime(each_value, datetime_format)
+        except (TypeError, ValueError):
+            continue
+        if datetime_obj.tzinfo is None:
+            datetime_obj = datetime_obj.replace(tzinfo=timezone.utc)
+        res[i] = (datetime_obj - datetime(1970, 1, 1, tzinfo=timezone.utc)) / timedelta(seconds=1)
+    return res
+
+
+FIXED_WIDTH_DIRECTIVES = {"%Y": 4, "%m": 2, "%d": 2, "%H": 2, "%M": 2, "%S": 2}
+"""
+Zero-padded numeric directives, formats made of them, ``%b`` and literals have fixed width.
+"""
+
+_DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+
+@cache
+def _compile_fixed_width_format(datetime_format: str):
+    """
+    Compile a fixed width format into its width, the position of each directive
+    and the position of each literal character.
+
+    Abbreviated month names (``%b``) of the current locale are supported
+    when all of them have the same length.
+
+    Returns None if the format contains other directives or lacks any of year, month and day.
+    """
+    month_abbr_widths = {len(each_abbr) for each_abbr in calendar.month_abbr[1:]}
+    fields = {}
+    literals = []
+    position = 0
+    i = 0
+    while i < len(datetime_format):
+        if datetime_format[i] != "%":
+            literals.append((position, ord(datetime_format[i])))
+            position += 1
+            i += 1
+            continue
+        directive = datetime_format[i : i + 2]
+        if directive == "%%":
+            literals.append((position, ord("%")))
+            position += 1
+        elif directive in fields:
+            return None
+        elif directive in FIXED_WIDTH_DIRECTIVES:
+            fields[directive] = (position, FIXED_WIDTH_DIRECTIVES[directive])
+            position += FIXED_WIDTH_DIRECTIVES[directive]
+        elif directive == "%b" and len(month_abbr_widths) == 1:
+            fields[directive] = (position, month_abbr_widths.pop())
+            position += fields[directive][1]
+        else:
+            return None
+        i += 2
+
+    if not {"%Y", "%d"} <= fields.keys() or len({"%m", "%b"} & fields.keys()) != 1:
+        return None
+    return position, fields, literals
+
+
+def _parse_fixed_width(values: np.ndarray, datetime_format: str) -> np.ndarray:
+    """
+    Parse datetime strings of a fixed width format into timestamps by integer arithmetic on
+    their characters, without going through ``strptime``.
+
+    Values that are not strings of the exact layout, or are not a valid date, become NaN.
+    """
+    width, fields, literals = _compile_fixed_width_format(datetime_format)
+    # One extra character to tell longer strings, which are truncated by the cast
+    chars = values.astype(f"U{width + 1}").view(np.uint32).reshape(-1, width + 1)
+    valid = (chars[:, width] == 0) & (chars[:, width - 1] != 0)
+    chars = chars[:, :width]
+    digits = chars.astype(np.int64) - ord("0")
+
+    for position, literal in literals:
+        valid &= chars[:, position] == literal
+
+    def read_field(directive, default=0):
+        if directive not in fields:
+            return np.full(len(chars), default, dtype=np.int64)
+        start, field_width = fields[directive]
+        field_digits = digits[:, start : start + field_width]
+        valid[:] &= ((field_digits >= 0) & (field_digits <= 9)).all(axis=1)
+        number = np.zeros(len(chars), dtype=np.int64)
+        for each_column in field_digits.T:
+            number = number * 10 + each_column
+        return number
+
+    def read_month_abbr():
+        start, field_width = fields["%b"]
+        field_chars = chars[:, start : start + field_width]
+        # Month names are case insensitive, lower ASCII letters for comparison
+        field_chars = np.where(
+            (field_chars >= ord("A")) & (field_chars <= ord("Z")), field_chars + 32, field_chars
+        )
+        number = np.zeros(len(chars), dtype=np.int64)
+        for each_month, each_abbr in enumerate(calendar.month_abbr[1:], start=1):
+            abbr_chars = np.array([ord(c) for c in each_abbr.lower()], dtype=np.uint32)
+            number[(field_chars == abbr_chars).all(axis=1)] = each_month
+        return number
+
+    year, day = read_field("%Y"), read_field("%d")
+    month = read_month_abbr() if "%b" in fields else read_field("%m")
+    hour, minute, second = read_field("%H"), read_field("%M"), read_field("%S")
+
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_index = np.clip(month - 1, 0, 11)
+    days_in_month = _DAYS_IN_MONTH[month_index] + ((month == 2) & leap)
+    valid &= (month >= 1) & (month <= 12) & (day >= 1) & (day <= days_in_month)
+    valid &= (hour < 24) & (minute < 60) & (second < 60)
+
+    # days from civil, see http://howardhinnant.github.io/date_algorithms.html#days_from_civil
+    civil_year = year - (month <= 2)
+    era = civil_year // 400
+    year_of_era = civil_year - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    days = era * 146097 + day_of_era - 719468
+
+    timestamps = days * 86400 + hour * 3600 + minute * 60 + second
+    valid &= (timestamps >= MIN_TIMESTAMP) & (timestamps <= MAX_TIMESTAMP)
+
+    return np.where(valid, timestamps, np.nan)
+
+
+STRFTIME_FIELDS = {
+    "%Y": ("year", "%04d"),
+    "%m": ("month", "%02d"),
+    "%d": ("day", "%02d"),
+    "%H": ("hour", "%02d"),
+    "%M": ("minute", "%02d"),
+    "%S": ("second", "%02d"),
+    "%f": ("microsecond", "%06d"),
+    "%b": ("month_abbr", "%s"),
+}
+"""
+Directives built from the date fields directly, with the field and its printf-style format.
+"""
+
+
+@cache
+def _compile_strftime_format(datetime_format: str):
+    """
+    Compile a format into a printf-style template and the date fields filling it,
+    building strings by the template is much faster than ``strftime``.
+
+    Returns None if the format contains other directives.
+    """
+    template = []
+    fields = []
+    i = 0
+    while i < len(datetime_format):
+        if datetime_format[i] != "%":
+            template.append(datetime_format[i])
+            i += 1
+            continue
+        directive = datetime_format[i : i + 2]
+        if directive == "%%":
+            template.append("%%")
+        elif directive in STRFTIME_FIELDS:
+            field, field_format = STRFTIME_FIELDS[directive]
+            template.append(field_format)
+            fields.append(field)
+        else:
+            return None
+        i += 2
+    return "".join(template), fields
+
+
+def _strftime(datetime_index: pd.DatetimeIndex, datetime_format: str) -> list:
+    """
+    Format datetime index by the compiled template of the format.
+    """
+    template, fields = _compile_strftime_format(datetime_format)
+    field_values = []
+    for field in fields:
+        if field == "month_abbr":
+            month_abbr = np.array(calendar.month_abbr, dtype=object)
+            field_values.append(month_abbr[datetime_index.month.to_numpy()].tolist())
+        else:
+            field_values.append(getattr(datetime_index, field).tolist())
+    return list(map(template.__mod__, zip(*field_values)))
+
+
+def _strftime_timestamps(timestamps: np.ndarray, datetime_format: str) -> list:
+    """
+    Format timestamps one by one through ``datetime``, for the timestamps beyond
+    the nanosecond range of pandas.
+
+    The compiled template of the format is used if any, so that years are padded the same way.
+    """
+    datetime_objs = [
+        datetime(1970, 1, 1) + timedelta(seconds=float(each_stamp)) for each_stamp in timestamps
+    ]
+    compiled = _compile_strftime_format(datetime_format)
+    if compiled is None:
+        return [each_obj.strftime(datetime_format) for each_obj in datetime_objs]
+    template, fields = compiled
+    return [
+        template
+        % tuple(
+            (
+                calendar.month_abbr[each_obj.month]
+                if field == "month_abbr"
+                else getattr(each_obj, field)
+            )
+            for field in fields
+        )
+        for each_obj in datetime_objs
+    ]
 
 
 class DatetimeFormatter(Formatter):
@@ -46,6 +323,11 @@ class DatetimeFormatter(Formatter):
     List to store columns that are no longer needed or to be removed.
     """
 
+    iso_datetime_columns: set = set()
+    """
+    Set to store the datetime columns whose format is ISO 8601, they are parsed by the fast path.
+    """
+
     def fit(self, metadata: Metadata | None = None, **kwargs: dict[str, Any]):
         """
         Fit method for datetime formatter, the datetime column and datetime format need to be recorded.
@@ -56,14 +338,14 @@ class DatetimeFormatter(Formatter):
         """
 
         # get from metadata
-        self.datetime_formats = metadata.get("datetime_format")
+        datetime_formats = metadata.get("datetime_format")
         datetime_columns = []
         dead_columns = []
         # Check datetime_formats and columns
         # exclude columns without format as there is huge risk of handling errors
         meta_datetime_columns = metadata.get("datetime_columns")
         for each_col in meta_datetime_columns:
-            if each_col in self.datetime_formats.keys():
+            if each_col in datetime_formats.keys():
                 datetime_columns.append(each_col)
             else:
                 dead_columns.append(each_col)
@@ -73,6 +355,18 @@ class DatetimeFormatter(Formatter):
 
         self.datetime_columns = datetime_columns
         self.dead_columns = dead_columns
+        # Resolve formats once here instead of in every conversion
+        self.datetime_formats = {
+            each_col: datetime_formats[each_col] for each_col in datetime_columns
+        }
+        self.iso_datetime_columns = {
+            each_col
+            for each_col, each_format in self.datetime_formats.items()
+            if each_format in ISO_DATETIME_FORMATS
+        }
+        # Compile the templates for formatting timestamps back in advance
+        for each_format in self.datetime_formats.values():
+            _compile_strftime_format(each_format)
 
         logger.info("DatetimeFormatter Fitted.")
         self.fitted = True
@@ -85,21 +379,21 @@ class DatetimeFormatter(Formatter):
         Args:
             - raw_data (pd.DataFrame): Unprocessed table data
         """
+        # remove the columns without format at once, they have been reported when fitting
+        dead_columns = [each_col for each_col in self.dead_columns if each_col in raw_data.columns]
+        if dead_columns:
+            raw_data = raw_data.drop(columns=dead_columns)
+
         if len(self.datetime_columns) == 0:
             logger.info(
                 "Converting data using DatetimeFormatter... Finished (No datetime columns)."
             )
             return raw_data
 
-        # remove the column without format
-        for each_col in self.dead_columns:
-            raw_data = self.remove_columns(raw_data, [each_col])
-            logger.warning(f"Column {each_col} was removed because lack of format info.")
-
         logger.info("Converting data using DatetimeFormatter...")
 
         res_data = self.convert_datetime_columns(
-            self.datetime_columns, self.datetime_formats, raw_data
+            self.datetime_columns, self.datetime_formats, raw_data, self.iso_datetime_columns
         )
 
         logger.info("Converting data using DatetimeFormatter... Finished.")
@@ -107,46 +401,164 @@ class DatetimeFormatter(Formatter):
         return res_data
 
     @staticmethod
-    def convert_datetime_columns(datetime_column_list, datetime_formats, processed_data):
+    def convert_datetime_columns(
+        datetime_column_list, datetime_formats, processed_data, iso_datetime_columns=None
+    ):
         """
         Convert datetime columns in processed_data from string to timestamp (int)
 
         Args:
             - datetime_column_list (list): List of columns that are date time type
+            - datetime_formats (dict): Dictionary with column names as keys and datetime formats as values
             - processed_data (pd.DataFrame): Processed table data
+            - iso_datetime_columns (set, optional): Columns with ISO 8601 format, inferred if not given
 
         Returns:
             - result_data (pd.DataFrame): Processed table data with datetime columns converted to timestamp
         """
 
+        def convert_strings_to_timestamp(str_data: pd.Series, datetime_format: str, is_iso: bool):
+            """
+            convert a column of datetime strings to timestamp value.
+            """
+            if is_iso:
+                # ISO 8601 strings are handled by pandas' C parser directly, no need to cache
+                res = _to_timestamp(_to_datetime(str_data, datetime_format), datetime_format)
+                # Values beyond the nanosecond range of pandas are left to strptime
+                unparsed = res.isna() & str_data.notna()
+                if unparsed.any():
+                    # Unparsed values are mostly repeated invalid strings, retry each one only once
+                    codes, uniques = pd.factorize(str_data[unparsed])
+                    res[unparsed] = _strptime_timestamps(
+                        np.asarray(uniques, dtype=object), datetime_format
+                    )[codes]
+                return res
+
+            # Other formats go through the slow strptime-like parser,
+            # so parse each distinct value only once and look up the rest by its code,
+            # factorize finds the distinct values and codes in one hash pass (a map needs two)
+            codes, uniques = pd.factorize(str_data)
+            uniques = np.asarray(uniques, dtype=object)
+            if _compile_fixed_width_format(datetime_format) is None:
+                unique_timestamps = _to_timestamp(
+                    _to_datetime(uniques, datetime_format), datetime_format
+                ).to_numpy(dtype=np.float64)
+            else:
+                # Numeric formats are parsed by integer arithmetic,
+                # leaving only values with other layouts (e.g. no zero padding) to pandas
+                unique_timestamps = _parse_fixed_width(uniques, datetime_format)
+                unparsed = np.isnan(unique_timestamps)
+                unique_timestamps[unparsed] = _to_timestamp(
+                    _to_datetime(uniques[unparsed], datetime_format), datetime_format
+                ).to_numpy()
+            # Values beyond the nanosecond range of pandas are left to strptime
+            unparsed = np.isnan(unique_timestamps)
+            if unparsed.any():
+                unique_timestamps[unparsed] = _strptime_timestamps(
+                    uniques[unparsed], datetime_format
+                )
+            # Missing values are not parsed, their code -1 looks up the trailing NaN
+            unique_timestamps = np.append(unique_timestamps, np.nan)
+            return pd.Series(unique_timestamps[codes], index=str_data.index)
+
         def convert_single_column_datetime_to_timestamp(
-            column_data: pd.Series, datetime_format: str
+            column_data: pd.Series, datetime_format: str, is_iso: bool
         ):
             """
             convert each single column datetime string to timestamp int value.
+
+            The conversion is chosen once by the dtype of the column: datetime columns are
+            converted directly, numeric columns are regarded as timestamps already, string columns
+            are parsed by ``pd.to_datetime`` at once. Columns mixing strings with other values are
+            split by a mask, strings are parsed as above and numbers are kept. Values which cannot
+            be parsed become ``NaT`` and are converted to timestamp 0.
+
+            Timestamps are stored as int64 seconds, unless the format has sub-second precision.
             """
-            res = []
-            for each_value in column_data:
-                try:
-                    datetime_obj = datetime.strptime(str(each_value), datetime_format)
-                    each_stamp = datetime.timestamp(datetime_obj)
-                except Exception as e:
-                    logger.warning(f"An error occured when convert str to timestamp {e}.")
-                    logger.warning(f"Input parameters: ({str(each_value)}, {datetime_format})")
-                    logger.warning(f"Input type: ({type(each_value)}, {type(datetime_format)})")
-                    each_stamp = 0
-                res.append(each_stamp)
-            return pd.Series(res)
-
-        # Make a copy of processed_data to avoid modifying the original data
-        result_data = processed_data.copy()
-
-        # Convert each datetime column in datetime_column_list to timestamp
+            if isinstance(column_data.dtype, np.dtype) and column_data.dtype.kind == "i":
+                # Integer timestamps are stored as they are, without copying when already int64
+                return column_data.astype(
+                    np.float64 if "%f" in datetime_format else np.int64, copy=False
+                )
+            elif pd.api.types.is_datetime64_any_dtype(column_data):
+                if column_data.dt.tz is not None:
+                    column_data = column_data.dt.tz_convert(None)
+                res = _to_timestamp(column_data, datetime_format)
+            elif pd.api.types.is_numeric_dtype(column_data) and not pd.api.types.is_bool_dtype(
+                column_data
+            ):
+                # Other numbers (e.g. float) are timestamps as well, only checked for missing values
+                res = column_data.to_numpy(dtype=np.float64, na_value=np.nan)
+            elif pd.api.types.infer_dtype(column_data, skipna=True) == "string":
+                res = convert_strings_to_timestamp(column_data, datetime_format, is_iso)
+            else:
+                values = column_data.to_numpy(dtype=object)
+                # Find missing values in one vectorized pass, they are left as NaN (timestamp 0)
+                # and only the rest is checked for strings
+                not_null = ~pd.isna(values)
+                is_str = np.zeros(len(values), dtype=bool)
+                is_str[not_null] = np.fromiter(
+                    (isinstance(v, str) for v in values[not_null]),
+                    dtype=bool,
+                    count=not_null.sum(),
+                )
+                is_other = not_null & ~is_str
+                others = column_data[is_other]
+                # Numbers are timestamps already, other objects are parsed as strings,
+                # bools are not timestamps though to_numeric takes them as 1 and 0
+                others_res = pd.to_numeric(others, errors="coerce").to_numpy(dtype=np.float64)
+                is_bool = np.fromiter(
+                    (isinstance(v, (bool, np.bool_)) for v in values[is_other]),
+                    dtype=bool,
+                    count=len(others),
+                )
+                not_number = np.isnan(others_res) | is_bool
+                others_res[not_number] = convert_strings_to_timestamp(
+                    others[not_number].astype(str), datetime_format, is_iso
+                ).to_numpy()
+
+                res = np.full(len(values), np.nan)
+                res[is_str] = convert_strings_to_timestamp(
+                    column_data[is_str], datetime_format, is_iso
+                ).to_numpy()
+                res[is_other] = others_res
+
+            res = np.asarray(res, dtype=np.float64)
+            # Missing values, failures and values beyond int64 become timestamp 0
+            converted = np.isfinite(res) & (np.abs(res) < 2**63)
+            n_failed = np.count_nonzero(~converted & column_data.notna().to_numpy())
+            if n_failed:
+                logger.warning(
+                    f"{n_failed} values in column {column_data.name} failed to convert to timestamp "
+                    f"with format {datetime_format}, they are set to 0."
+                )
+            res = np.where(converted, res, 0)
+            if "%f" not in datetime_format:
+                res = np.floor(res).astype(np.int64)
+            return pd.Series(res, index=column_data.index)
+
+        # Make a shallow copy of processed_data to avoid modifying the original data,
+        # converted columns are assigned as new columns so the others need not be copied
+        result_data = processed_data.copy(deep=False)
+
+        if iso_datetime_columns is None:
+            iso_datetime_columns = {
+                column
+                for column in datetime_column_list
+                if datetime_formats[column] in ISO_DATETIME_FORMATS
+            }
+
+        # Convert each datetime column in datetime_column_list to timestamp, one after another:
+        # the work per column mostly holds the GIL (hashing and strptime on object arrays),
+        # so a thread pool would not convert columns in parallel
         for column in datetime_column_list:
             # Convert datetime to timestamp (int)
             timestamp_col = convert_single_column_datetime_to_timestamp(
-                processed_data[column], datetime_formats[column]
+                processed_data[column], datetime_formats[column], column in iso_datetime_columns
             )
+            # Assign column by column: assigning all of them at once (df[cols] = pd.DataFrame(...))
+            # builds an intermediate frame and is still set column by column inside pandas,
+            # so it is slower on the shallow copy
             result_data[column] = timestamp_col
 
         return result_data
@@ -191,23 +603,51 @@ class DatetimeFormatter(Formatter):
         def convert_single_column_timestamp_to_str(column_data: pd.Series, datetime_format: str):
             """
             convert each single column timestamp(int) to datetime string.
+
+            Timestamps which are missing or out of the supported range become "No Datetime".
             """
-            res = []
-
-            for each_stamp in column_data:
-                try:
-                    each_str = datetime.fromtimestamp(each_stamp).strftime(datetime_format)
-                except Exception as e:
-                    logger.debug(f"An error occured when convert timestamp to str {e}.")
-                    each_str = "No Datetime"
-
-                res.append(each_str)
-            res = pd.Series(res)
-            res = res.astype(str)
-            return res
-
-        # Copy the processed data to result_data
-        result_data = processed_data.copy()
+            timestamps = pd.to_numeric(column_data, errors="coerce").to_numpy()
+            valid = (timestamps >= MIN_TIMESTAMP) & (timestamps <= MAX_TIMESTAMP)
+            # Bounds are exclusive so that fractions cannot overflow the nanoseconds
+            in_ns_range = valid & (timestamps > MIN_NS_TIMESTAMP) & (timestamps < MAX_NS_TIMESTAMP)
+
+            # Convert all timestamps in a single pass, the ones beyond the nanosecond range
+            # as the epoch and overwrite them afterwards, instead of selecting the others first
+            if np.issubdtype(timestamps.dtype, np.integer):
+                nanoseconds = np.where(in_ns_range, timestamps, 0).astype(np.int64) * 10**9
+            else:
+                ns_timestamps = np.where(in_ns_range, timestamps, 0)
+                # Split whole seconds from fractions to keep whole seconds exact
+                seconds = np.floor(ns_timestamps)
+                nanoseconds = seconds.astype(np.int64) * 10**9 + np.round(
+                    (ns_timestamps - seconds) * 10**9
+                ).astype(np.int64)
+            # Work on a DatetimeIndex, formatting a whole index is a single call
+            datetime_index = pd.DatetimeIndex(nanoseconds.view("datetime64[ns]"), copy=False)
+
+            if _compile_strftime_format(datetime_format) is not None:
+                res = np.array(_strftime(datetime_index, datetime_format), dtype=object)
+            else:
+                # DatetimeIndex.strftime formats Timestamp by Timestamp,
+                # formatting plain datetime objects is faster
+                res = np.array(
+                    [
+                        each_obj.strftime(datetime_format)
+                        for each_obj in datetime_index.to_pydatetime()
+                    ],
+                    dtype=object,
+                )
+            # Rare timestamps beyond the nanosecond range (e.g. 9999-12-31) are formatted by datetime
+            out_of_ns_range = valid & ~in_ns_range
+            if out_of_ns_range.any():
+                res[out_of_ns_range] = _strftime_timestamps(
+                    timestamps[out_of_ns_range], datetime_format
+                )
+            res[~valid] = "No Datetime"
+            return pd.Series(res, index=column_data.index)
+
+        # Shallow copy the processed data to result_data, only converted columns are replaced
+        result_data = processed_data.copy(deep=False)
 
         # Iterate over each column in the timestamp_column_list
         for column in timestamp_column_list:
@@ -5,7 +5,11 @@ import pandas as pd
 import pytest
 
 from sdgx.data_models.metadata import Metadata
-from sdgx.data_processors.formatters.datetime import DatetimeFormatter
+from sdgx.data_processors.formatters.datetime import (
+    DatetimeFormatter,
+    _parse_fixed_width,
+)
+from sdgx.utils import logger
 
 
 @pytest.fixture
@@ -123,6 +127,10 @@ def test_datetime_formatter_test_df_dead_column(datetime_test_df: pd.DataFrame):
         "simple_datetime",
     }  # all dead
 
+    # dead columns are removed even if there is no datetime column to convert
+    converted_df = transformer.convert(datetime_test_df)
+    assert converted_df.columns.to_list() == ["int_id", "str_id", "not_int_id", "not_str_id"]
+
 
 def test_datetime_formatter_test_df(datetime_test_df: pd.DataFrame):
     """
@@ -189,3 +197,192 @@ def test_datetime_formatter_test_df(datetime_test_df: pd.DataFrame):
     # check if the dataframe is equal to the original one
     # use the eq method and .all().all() to check the equality of two 2d dataframes
     assert reverse_converte_df.eq(datetime_test_df).all().all()
+
+
+def test_datetime_formatter_timestamp_input():
+    """
+    Test that DatetimeFormatter keeps numeric columns, which are timestamps already, unchanged.
+    """
+    timestamp_df = pd.DataFrame(
+        {
+            "date": ["2023-12-27", "2023-12-28", "2023-12-27", "2023-12-28"],
+            "timestamp": [1703635200.0, 1703721600.0, np.nan, 0.0],
+        }
+    )
+    converted_df = DatetimeFormatter.convert_datetime_columns(
+        ["date", "timestamp"],
+        {"date": "%Y-%m-%d", "timestamp": "%Y-%m-%d"},
+        timestamp_df,
+    )
+
+    assert converted_df["date"].to_list() == [1703635200, 1703721600, 1703635200, 1703721600]
+    assert converted_df["timestamp"].to_list() == [1703635200, 1703721600, 0, 0]
+    # input is not modified
+    assert timestamp_df["date"].to_list() == [
+        "2023-12-27",
+        "2023-12-28",
+        "2023-12-27",
+        "2023-12-28",
+    ]
+
+
+def test_datetime_formatter_mixed_input():
+    """
+    Test DatetimeFormatter with a column mixing datetime strings, timestamps and missing values.
+    """
+    mixed_df = pd.DataFrame(
+        {"date": ["2023-12-27", 1703721600.0, np.nan, "not a date", True, np.False_]}
+    )
+    converted_df = DatetimeFormatter.convert_datetime_columns(
+        ["date"], {"date": "%Y-%m-%d"}, mixed_df
+    )
+
+    # bools are not timestamps, they fail to convert
+    assert converted_df["date"].to_list() == [1703635200, 1703721600, 0, 0, 0, 0]
+
+
+def test_datetime_formatter_fixed_width_format():
+    """
+    Test DatetimeFormatter with a numeric non-ISO format, including values without zero padding
+    and invalid dates.
+    """
+    fixed_width_df = pd.DataFrame({"date": ["27/12/2023", "1/2/2024", "29/02/2023", "28/12/2023"]})
+    converted_df = DatetimeFormatter.convert_datetime_columns(
+        ["date"], {"date": "%d/%m/%Y"}, fixed_width_df
+    )
+
+    assert converted_df["date"].to_list() == [1703635200, 1706745600, 0, 1703721600]
+
+    # the whole range of years is parsed by integer arithmetic, without falling back to pandas
+    parsed = _parse_fixed_width(
+        np.array(["31/12/9999", "01/01/0001", "01/01/0000"], dtype=object), "%d/%m/%Y"
+    )
+    np.testing.assert_array_equal(parsed, [253402214400, -62135596800, np.nan])
+
+
+def test_datetime_formatter_out_of_nanosecond_range():
+    """
+    Test DatetimeFormatter with dates beyond the nanosecond range of pandas (1677 to 2262).
+    """
+    out_of_range_df = pd.DataFrame(
+        {
+            "iso_date": ["9999-12-31", "1600-01-01", "2023-12-27", np.nan],
+            "date": ["31 Dec 9999", "01 Jan 1600", "27 Dec 2023", "not a date"],
+            "fixed_width_date": ["31/12/9999", "1/1/1600", "27/12/2023", "29/02/2023"],
+        }
+    )
+    converted_df = DatetimeFormatter.convert_datetime_columns(
+        ["iso_date", "date", "fixed_width_date"],
+        {"iso_date": "%Y-%m-%d", "date": "%d %b %Y", "fixed_width_date": "%d/%m/%Y"},
+        out_of_range_df,
+    )
+
+    assert converted_df["iso_date"].to_list() == [
+        253402214400,
+        -11676096000,
+        1703635200,
+        0,
+    ]
+    assert converted_df["date"].to_list() == [253402214400, -11676096000, 1703635200, 0]
+    assert converted_df["fixed_width_date"].to_list() == [
+        253402214400,
+        -11676096000,
+        1703635200,
+        0,
+    ]
+
+    reversed_df = DatetimeFormatter.convert_timestamp_to_datetime(
+        ["iso_date", "date"], {"iso_date": "%Y-%m-%d", "date": "%d %b %Y"}, converted_df
+    )
+    assert reversed_df["iso_date"].to_list()[:3] == ["9999-12-31", "1600-01-01", "2023-12-27"]
+    assert reversed_df["date"].to_list()[:3] == ["31 Dec 9999", "01 Jan 1600", "27 Dec 2023"]
+
+
+def test_datetime_formatter_reverse_convert_edge_cases():
+    """
+    Test converting timestamps back to datetime strings with missing, infinite, negative
+    fractional and out of range timestamps, and with a format formatted by ``strftime``.
+    """
+    timestamp_df = pd.DataFrame(
+        {
+            "float_timestamp": [1703635200.0, np.nan, np.inf, -1.5, 1e20],
+            "int_timestamp": pd.Series([1703635200, pd.NA, 0, -1, 10**12], dtype="Int64"),
+            "day_of_year": [1703635200, 0, -1, 253402300799, 253402300800],
+        }
+    )
+    reversed_df = DatetimeFormatter.convert_timestamp_to_datetime(
+        ["float_timestamp", "int_timestamp", "day_of_year"],
+        {
+            "float_timestamp": "%Y-%m-%d %H:%M:%S",
+            "int_timestamp": "%Y-%m-%d %H:%M:%S",
+            "day_of_year": "%Y %j",
+        },
+        timestamp_df,
+    )
+
+    assert reversed_df["float_timestamp"].to_list() == [
+        "2023-12-27 00:00:00",
+        "No Datetime",
+        "No Datetime",
+        "1969-12-31 23:59:58",
+        "No Datetime",
+    ]
+    assert reversed_df["int_timestamp"].to_list() == [
+        "2023-12-27 00:00:00",
+        "No Datetime",
+        "1970-01-01 00:00:00",
+        "1969-12-31 23:59:59",
+        "No Datetime",
+    ]
+    assert reversed_df["day_of_year"].to_list() == [
+        "2023 361",
+        "1970 001",
+        "1969 365",
+        "9999 365",
+        "No Datetime",
+    ]
+
+
+def test_datetime_formatter_utc_offset():
+    """
+    Test DatetimeFormatter with a format with UTC offset, with a single offset and mixed offsets.
+    """
+    offset_df = pd.DataFrame(
+        {
+            "single_offset": ["2023-12-27 10:00:00+0100", "2023-12-28 10:00:00+0100"],
+            "mixed_offsets": ["2023-12-27 10:00:00+0100", "2023-12-28 10:00:00+0000"],
+        }
+    )
+    converted_df = DatetimeFormatter.convert_datetime_columns(
+        ["single_offset", "mixed_offsets"],
+        {"single_offset": "%Y-%m-%d %H:%M:%S%z", "mixed_offsets": "%Y-%m-%d %H:%M:%S%z"},
+        offset_df,
+    )
+
+    assert converted_df["single_offset"].to_list() == [1703667600, 1703754000]
+    assert converted_df["mixed_offsets"].to_list() == [1703667600, 1703757600]
+
+
+def test_datetime_formatter_failure_warning():
+    """
+    Test that values failing to convert are reported by a single warning per column with their
+    count, missing values are not counted as failures.
+    """
+    failure_df = pd.DataFrame(
+        {
+            "date": ["2023-12-27", "not a date", "2023-13-01", np.nan, None, "N/A"],
+            "valid_date": ["2023-12-27", "2023-12-28", np.nan, None, "2023-12-29", "2023-12-30"],
+        }
+    )
+    messages = []
+    handler_id = logger.add(messages.append, level="WARNING", format="{message}")
+    try:
+        converted_df = DatetimeFormatter.convert_datetime_columns(
+            ["date", "valid_date"], {"date": "%Y-%m-%d", "valid_date": "%Y-%m-%d"}, failure_df
+        )
+    finally:
+        logger.remove(handler_id)
+
+    assert converted_df["date"].to_list() == [1703635200, 0, 0, 0, 0, 0]
+    assert len(messages) == 1
+    assert messages[0].startswith("3 values in column date failed to convert to timestamp")